@@ -15,3 +15,4 @@ def test_collect_language_codes():
 def test_split_css_class():
     class_str = ' foo bar baz spam-egg foo '
     assert split_css_class(class_str) == {'foo', 'bar', 'baz', 'spam-egg'}
+
@@ -2,7 +2,6 @@ import collections
 from typing import List, Union
 
 from django.conf import settings
-from django.db.models import Count
 from django.http import Http404
 from django.utils.timezone import make_naive
 from rest_framework.generics import ListAPIView, RetrieveAPIView
@@ -28,7 +27,7 @@ class TalkListAPIView(ListAPIView):
     serializer_class = serializers.TalkListSerializer
 
     def get_queryset(self):
-        queryset = ProposedTalkEvent.objects.all()
+        queryset = ProposedTalkEvent.objects.for_display()
         category = self.kwargs.get('category')
         if category is not None:
             queryset = queryset.filter(proposal__category=category)
@@ -39,7 +38,7 @@ class SponsoredEventListAPIView(ListAPIView):
     serializer_class = serializers.SponsoredEventListSerializer
 
     def get_queryset(self):
-        queryset = SponsoredEvent.objects.all()
+        queryset = SponsoredEvent.objects.select_related('host')
         category = self.kwargs.get('category')
         if category is not None:
             queryset = queryset.filter(category=category)
@@ -50,7 +49,7 @@ class TutorialListAPIView(ListAPIView):
     serializer_class = serializers.TutorialListSerializer
 
     def get_queryset(self):
-        queryset = ProposedTutorialEvent.objects.all()
+        queryset = ProposedTutorialEvent.objects.for_display()
         category = self.kwargs.get('category')
         if category is not None:
             queryset = queryset.filter(proposal__category=category)
@@ -99,17 +98,17 @@ class SpeechListByCategoryAPIView(APIView):
 
 
 class TalkDetailAPIView(RetrieveAPIView):
-    queryset = ProposedTalkEvent.objects.all()
+    queryset = ProposedTalkEvent.objects.for_display()
     serializer_class = serializers.TalkDetailSerializer
 
 
 class SponsoredEventDetailAPIView(RetrieveAPIView):
-    queryset = SponsoredEvent.objects.all()
+    queryset = SponsoredEvent.objects.select_related('host')
     serializer_class = serializers.SponsoredEventDetailSerializer
 
 
 class TutorialDetailAPIView(RetrieveAPIView):
-    queryset = ProposedTutorialEvent.objects.all()
+    queryset = ProposedTutorialEvent.objects.for_display()
     serializer_class = serializers.TutorialDetailSerializer
 
 
@@ -183,13 +182,7 @@ class EventWrapper:
         if isinstance(self.obj, SponsoredEvent):
             return [self.obj.host.speaker_name]
         elif isinstance(self.obj, (ProposedTalkEvent, ProposedTutorialEvent)):
-            speaker_names = [self.obj.proposal.submitter.speaker_name]
-            if getattr(self.obj, '_additional_speaker_count', 1):
-                speaker_names.extend(
-                    self.obj.proposal.additionalspeaker_set
-                    .values_list('user__speaker_name', flat=True),
-                )
-            return speaker_names
+            return [s.user.speaker_name for s in self.obj.proposal.speakers]
         else:
             return []
 
@@ -273,21 +266,9 @@ class ScheduleAPIView(APIView):
     event_querysets = [
         CustomEvent.objects.all().exclude(location=Location.OTHER),
         KeynoteEvent.objects.all().exclude(location=Location.OTHER),
-        (
-            ProposedTalkEvent.objects
-            .select_related('proposal__submitter')
-            .annotate(_additional_speaker_count=Count(
-                'proposal__additionalspeaker_set',
-            )).exclude(location=Location.OTHER)
-        ),
+        ProposedTalkEvent.objects.for_display().exclude(location=Location.OTHER),
         SponsoredEvent.objects.select_related('host').exclude(location=Location.OTHER),
-        (
-            ProposedTutorialEvent.objects
-            .select_related('proposal__submitter')
-            .annotate(_additional_speaker_count=Count(
-                'proposal__additionalspeaker_set',
-            )).exclude(location=Location.OTHER)
-        ),
+        ProposedTutorialEvent.objects.for_display().exclude(location=Location.OTHER),
     ]
 
     def get(self, request):
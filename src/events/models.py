@@ -22,7 +22,12 @@ from core.models import (
     EventInfo,
 )
 from core.utils import format_html_lazy
-from proposals.models import PrimarySpeaker, TalkProposal, TutorialProposal
+from proposals.models import (
+    PrimarySpeaker,
+    ProposalQuerySet,
+    TalkProposal,
+    TutorialProposal,
+)
 from sponsors.models import Sponsor
 
 MIDNIGHT_TIME = datetime.time(tzinfo=pytz.timezone('Asia/Taipei'))
@@ -370,6 +375,15 @@ class ProposedEventManager(DefaultConferenceManagerMixin, models.Manager):
         """
         return super().get_queryset().select_related(self.proposal_attr)
 
+    def for_display(self):
+        """Load everything the proposal's ``speakers`` needs.
+        """
+        return self.select_related(
+            f'{self.proposal_attr}__submitter',
+        ).prefetch_related(ProposalQuerySet.additional_speakers_prefetch(
+            f'{self.proposal_attr}__additionalspeaker_set',
+        ))
+
 
 class ProposedTalkEvent(BaseEvent):
 
@@ -2,6 +2,7 @@ import pytest
 from django.urls import reverse
 
 from events.models import ProposedTalkEvent, ProposedTutorialEvent, SponsoredEvent
+from proposals.models import AdditionalSpeaker, TalkProposal, TutorialProposal
 
 
 @pytest.mark.parametrize(
@@ -47,3 +48,27 @@ def test_list_speeches_by_category(category, api_client):
     )
 
     assert response.status_code == 200
+
+
+@pytest.mark.parametrize('event_count', [1, 3])
+def test_list_speeches_num_queries(
+        event_count, api_client, user, another_user,
+        django_assert_num_queries):
+    for i in range(event_count):
+        talk = TalkProposal.objects.create(
+            submitter=user, title=f'Talk {i}', accepted=True,
+        )
+        AdditionalSpeaker.objects.create(user=another_user, proposal=talk)
+        ProposedTalkEvent.objects.create(proposal=talk)
+        tutorial = TutorialProposal.objects.create(
+            submitter=user, title=f'Tutorial {i}', accepted=True,
+        )
+        AdditionalSpeaker.objects.create(user=another_user, proposal=tutorial)
+        ProposedTutorialEvent.objects.create(proposal=tutorial)
+
+    with django_assert_num_queries(6):
+        response = api_client.get('/api/events/speeches/')
+
+    assert response.status_code == 200
+    assert len(response.json()) == 2 * event_count
+    assert all(len(event['speakers']) == 2 for event in response.json())
@@ -0,0 +1,52 @@
+import datetime
+import itertools
+
+import pytest
+from django.conf import settings
+from django.utils.timezone import make_aware
+
+from events.models import Location, ProposedTalkEvent, ProposedTutorialEvent, Time
+from proposals.models import AdditionalSpeaker, TalkProposal, TutorialProposal
+
+
+@pytest.mark.parametrize('event_count', [1, 3])
+def test_schedule_num_queries(
+        event_count, api_client, user, another_user,
+        django_assert_num_queries):
+    # The view expects every conference day to have events.
+    days = list(settings.EVENTS_DAY_NAMES)
+    for i, day in itertools.product(range(event_count), days):
+        begin_time = Time.objects.create(value=make_aware(
+            datetime.datetime.combine(day, datetime.time(9 + i)),
+        ))
+        end_time = Time.objects.create(
+            value=begin_time.value + datetime.timedelta(minutes=30),
+        )
+        for proposal_model, event_model, location in [
+                (TalkProposal, ProposedTalkEvent, Location.R0),
+                (TutorialProposal, ProposedTutorialEvent, Location.R1)]:
+            proposal = proposal_model.objects.create(
+                submitter=user, title=f'Event {i}', accepted=True,
+            )
+            AdditionalSpeaker.objects.create(
+                user=another_user, proposal=proposal,
+            )
+            event_model.objects.create(
+                proposal=proposal, location=location,
+                begin_time=begin_time, end_time=end_time,
+            )
+
+    with django_assert_num_queries(9):
+        response = api_client.get('/api/events/schedule/')
+
+    assert response.status_code == 200
+    events = [
+        event
+        for day_info in response.json()['data']
+        for events in day_info['slots'].values()
+        for event in events
+    ]
+    assert len(events) == 2 * event_count * len(days)
+    assert all(
+        event['speakers'] == ['User', 'Misaki Mei'] for event in events
+    )
@@ -1,10 +1,9 @@
 import logging
 
-from django.db.models import Count, Prefetch
 from django.views.generic import DetailView, ListView
 
 from core.utils import OrderedDefaultDict, TemplateExistanceStatusResponse
-from proposals.models import AdditionalSpeaker, TalkProposal, TutorialProposal
+from proposals.models import TalkProposal, TutorialProposal
 
 from .models import ProposedTalkEvent, ProposedTutorialEvent, SponsoredEvent
 
@@ -16,7 +15,6 @@ class AcceptedProposalMixin:
         return (
             super().get_queryset()
             .filter_accepted()
-            .annotate(_additional_speaker_count=Count('additionalspeaker_set'))
             .select_related('submitter')
         )
 
@@ -28,18 +26,7 @@ class TalkListView(AcceptedProposalMixin, ListView):
 
     def get_categorized_talks(self):
         category_map = OrderedDefaultDict(list)
-        proposals = (
-            self.get_queryset()
-                .prefetch_related(Prefetch(
-                    'additionalspeaker_set',
-                    queryset=(
-                        AdditionalSpeaker.objects
-                        .filter(cancelled=False)
-                        .select_related('user')
-                    ),
-                    to_attr='_additional_speakers',
-                ))
-        )
+        proposals = self.get_queryset().for_display()
         for proposal in proposals:
             category_map[proposal.get_category_display()].append(proposal)
         return category_map
@@ -1,19 +1,40 @@
 from django.contrib import admin
-from django.contrib.contenttypes.admin import GenericTabularInline
+from django.db import models
+from django.utils.translation import gettext_lazy as _
 from import_export.admin import ExportMixin
 
 from .models import AdditionalSpeaker, LLMReview, TalkProposal, TutorialProposal
 from .resources import TalkProposalResource, TutorialProposalResource
 
 
-class AdditionalSpeakerInline(GenericTabularInline):
+class AdditionalSpeakerInline(admin.TabularInline):
     model = AdditionalSpeaker
     fields = ['user', 'status', 'cancelled']
-    ct_field = 'proposal_type'
-    ct_fk_field = 'proposal_id'
     extra = 0
 
 
+class LabelListFilter(admin.SimpleListFilter):
+    title = _('labels')
+    parameter_name = 'label'
+
+    def lookups(self, request, model_admin):
+        labels = (
+            model_admin.get_queryset(request)
+            .annotate(label=models.Func(
+                'labels', function='unnest', output_field=models.CharField(),
+            ))
+            .values_list('label', flat=True)
+            .order_by('label')
+            .distinct()
+        )
+        return [(label, label) for label in labels]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(labels__contains=[self.value()])
+        return queryset
+
+
 class ProposalAdmin(admin.ModelAdmin):
     list_display = [
         'title',
@@ -26,7 +47,7 @@ class ProposalAdmin(admin.ModelAdmin):
     list_filter = [
         'cancelled', 'accepted',
         'category', 'duration', 'language', 'python_level',
-        'labels',
+        LabelListFilter,
     ]
     raw_id_fields = ['submitter']
     search_fields = ['title', 'abstract']
@@ -41,6 +62,7 @@ class LLMReviewInline(admin.StackedInline):
         'translated_stage_diff', 'created_at',
     ]
     readonly_fields = ['created_at']
+    ordering = ['stage', '-created_at']
     can_delete = True
     max_num = 2
     min_num = 0
@@ -36,7 +36,7 @@ class LLMReviewListCreateAPIView(generics.ListCreateAPIView):
     authentication_classes = [TokenAuthentication, SessionAuthentication]
     permission_classes = [IsAuthenticated]
     serializer_class = LLMReviewSerializer
-    queryset = LLMReview.objects.all()
+    queryset = LLMReview.objects.for_list_view()
 
     def perform_create(self, serializer):
         serializer.save()
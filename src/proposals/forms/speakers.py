@@ -153,7 +153,7 @@ class AdditionalSpeakerSetStatusForm(AdditionalSpeakerUpdateForm):
 
     def clean_status(self):
         status = self.cleaned_data['status']
-        if status == AdditionalSpeaker.SPEAKING_STATUS_PENDING:
+        if status == AdditionalSpeaker.SpeakingStatus.PENDING:
             raise forms.ValidationError(
                 'Additional speaker status can not be changed to Pending '
                 'from another status.'
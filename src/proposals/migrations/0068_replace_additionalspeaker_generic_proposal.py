@@ -0,0 +1,120 @@
+# Generated by Django 3.2.25 on 2026-10-15 06:09
+
+import functools
+import operator
+
+import core.models
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+PROPOSAL_FIELD_MODELS = {
+    'talk_proposal': 'talkproposal',
+    'tutorial_proposal': 'tutorialproposal',
+}
+
+
+def delete_dangling_speakers(apps, schema_editor):
+    """Delete speakers whose generic proposal does not exist.
+
+    The generic relation had no referential integrity, so a speaker can point
+    to a deleted proposal, or to something not a proposal at all. Such rows
+    would violate the new foreign keys and check constraint.
+    """
+    AdditionalSpeaker = apps.get_model('proposals', 'AdditionalSpeaker')
+    db_alias = schema_editor.connection.alias
+    valid = functools.reduce(operator.or_, (
+        models.Q(
+            proposal_type__app_label='proposals',
+            proposal_type__model=model_name,
+            proposal_id__in=(
+                apps.get_model('proposals', model_name).objects
+                .using(db_alias).values('pk')
+            ),
+        )
+        for model_name in PROPOSAL_FIELD_MODELS.values()
+    ))
+    AdditionalSpeaker.objects.using(db_alias).exclude(valid).delete()
+
+
+def fill_proposal_fields(apps, schema_editor):
+    delete_dangling_speakers(apps, schema_editor)
+    AdditionalSpeaker = apps.get_model('proposals', 'AdditionalSpeaker')
+    db_alias = schema_editor.connection.alias
+    for field_name, model_name in PROPOSAL_FIELD_MODELS.items():
+        AdditionalSpeaker.objects.using(db_alias).filter(
+            proposal_type__app_label='proposals',
+            proposal_type__model=model_name,
+        ).update(**{
+            f'{field_name}_id': models.F('proposal_id'),
+        })
+
+
+def fill_generic_fields(apps, schema_editor):
+    AdditionalSpeaker = apps.get_model('proposals', 'AdditionalSpeaker')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    db_alias = schema_editor.connection.alias
+    for field_name, model_name in PROPOSAL_FIELD_MODELS.items():
+        content_type, _ = ContentType.objects.using(db_alias).get_or_create(
+            app_label='proposals', model=model_name,
+        )
+        AdditionalSpeaker.objects.using(db_alias).filter(**{
+            f'{field_name}__isnull': False,
+        }).update(
+            proposal_type=content_type,
+            proposal_id=models.F(f'{field_name}_id'),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('proposals', '0067_auto_20250512_1734'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='additionalspeaker',
+            options={'ordering': ['talk_proposal', 'tutorial_proposal', 'pk'], 'verbose_name': 'additional speaker', 'verbose_name_plural': 'additional speakers'},
+        ),
+        migrations.AddField(
+            model_name='additionalspeaker',
+            name='talk_proposal',
+            field=core.models.BigForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='additionalspeaker_set', to='proposals.talkproposal', verbose_name='talk proposal'),
+        ),
+        migrations.AddField(
+            model_name='additionalspeaker',
+            name='tutorial_proposal',
+            field=core.models.BigForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='additionalspeaker_set', to='proposals.tutorialproposal', verbose_name='tutorial proposal'),
+        ),
+        migrations.AlterField(
+            model_name='additionalspeaker',
+            name='proposal_type',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype', verbose_name='proposal model type'),
+        ),
+        migrations.AlterField(
+            model_name='additionalspeaker',
+            name='proposal_id',
+            field=models.BigIntegerField(null=True, verbose_name='proposal ID'),
+        ),
+        migrations.RunPython(fill_proposal_fields, fill_generic_fields),
+        migrations.AlterUniqueTogether(
+            name='additionalspeaker',
+            unique_together={('user', 'tutorial_proposal'), ('user', 'talk_proposal')},
+        ),
+        migrations.AddConstraint(
+            model_name='additionalspeaker',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('talk_proposal__isnull', False), ('tutorial_proposal__isnull', True)), models.Q(('talk_proposal__isnull', True), ('tutorial_proposal__isnull', False)), _connector='OR'), name='additionalspeaker_single_proposal'),
+        ),
+        migrations.RemoveField(
+            model_name='additionalspeaker',
+            name='proposal_id',
+        ),
+        migrations.RemoveField(
+            model_name='additionalspeaker',
+            name='proposal_type',
+        ),
+    ]
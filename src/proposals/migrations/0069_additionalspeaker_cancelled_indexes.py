@@ -0,0 +1,33 @@
+# Generated by Django 3.2.25 on 2026-10-15 06:12
+
+import core.models
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0068_replace_additionalspeaker_generic_proposal'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='additionalspeaker',
+            name='talk_proposal',
+            field=core.models.BigForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='additionalspeaker_set', to='proposals.talkproposal', verbose_name='talk proposal'),
+        ),
+        migrations.AlterField(
+            model_name='additionalspeaker',
+            name='tutorial_proposal',
+            field=core.models.BigForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='additionalspeaker_set', to='proposals.tutorialproposal', verbose_name='tutorial proposal'),
+        ),
+        migrations.AddIndex(
+            model_name='additionalspeaker',
+            index=models.Index(fields=['talk_proposal', 'cancelled'], name='addspk_talk_cancelled_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='additionalspeaker',
+            index=models.Index(fields=['tutorial_proposal', 'cancelled'], name='addspk_tutorial_cancelled_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-15 06:17
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0069_additionalspeaker_cancelled_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='llmreview',
+            options={'verbose_name': 'LLM review', 'verbose_name_plural': 'LLM reviews'},
+        ),
+    ]
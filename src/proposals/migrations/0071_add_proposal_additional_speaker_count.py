@@ -0,0 +1,46 @@
+# Generated by Django 3.2.25 on 2026-10-15 06:24
+
+from django.db import migrations, models
+
+
+def fill_additional_speaker_count(apps, schema_editor):
+    AdditionalSpeaker = apps.get_model('proposals', 'AdditionalSpeaker')
+    db_alias = schema_editor.connection.alias
+    for model_name, field_name in [
+            ('TalkProposal', 'talk_proposal'),
+            ('TutorialProposal', 'tutorial_proposal')]:
+        Proposal = apps.get_model('proposals', model_name)
+        count = (
+            AdditionalSpeaker.objects.using(db_alias)
+            .filter(cancelled=False, **{field_name: models.OuterRef('pk')})
+            .order_by()
+            .annotate(count=models.Func('pk', function='COUNT'))
+            .values('count')
+        )
+        Proposal.objects.using(db_alias).update(
+            additional_speaker_count=models.Subquery(count),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0070_alter_llmreview_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='talkproposal',
+            name='additional_speaker_count',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name='additional speaker count'),
+        ),
+        migrations.AddField(
+            model_name='tutorialproposal',
+            name='additional_speaker_count',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name='additional speaker count'),
+        ),
+        migrations.RunPython(
+            fill_additional_speaker_count,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 3.2.25 on 2026-10-15 06:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0071_add_proposal_additional_speaker_count'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='talkproposal',
+            name='accepted',
+            field=models.NullBooleanField(choices=[(None, '----------'), (True, 'Accepted'), (False, 'Rejected')], default=None, verbose_name='accepted'),
+        ),
+        migrations.AlterField(
+            model_name='talkproposal',
+            name='cancelled',
+            field=models.BooleanField(default=False, verbose_name='cancelled'),
+        ),
+        migrations.AlterField(
+            model_name='tutorialproposal',
+            name='accepted',
+            field=models.NullBooleanField(choices=[(None, '----------'), (True, 'Accepted'), (False, 'Rejected')], default=None, verbose_name='accepted'),
+        ),
+        migrations.AlterField(
+            model_name='tutorialproposal',
+            name='cancelled',
+            field=models.BooleanField(default=False, verbose_name='cancelled'),
+        ),
+        migrations.AddIndex(
+            model_name='talkproposal',
+            index=models.Index(condition=models.Q(('accepted', True), ('cancelled', False)), fields=['conference'], name='talkproposal_accepted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tutorialproposal',
+            index=models.Index(condition=models.Q(('accepted', True), ('cancelled', False)), fields=['conference'], name='tutorialproposal_accepted_idx'),
+        ),
+    ]
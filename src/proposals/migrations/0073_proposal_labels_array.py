@@ -0,0 +1,78 @@
+# Generated by Django 3.2.25 on 2026-10-15 06:28
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+# Existing labels are comma-separated strings. Refuse to convert (instead of
+# silently truncating) if any label does not fit the new element length.
+LABELS_TO_ARRAY = """
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM "proposals_{model_name}",
+                unnest(regexp_split_to_array(btrim("labels"), '\\s*,\\s*'))
+                    AS "label"
+            WHERE length("label") > 32
+        ) THEN
+            RAISE EXCEPTION
+                'proposals_{model_name} has labels longer than 32 characters';
+        END IF;
+    END $$;
+    ALTER TABLE "proposals_{model_name}" ALTER COLUMN "labels"
+        SET DATA TYPE varchar(32)[]
+        USING array_remove(
+            regexp_split_to_array(btrim("labels"), '\\s*,\\s*'), ''
+        )::varchar(32)[];
+"""
+
+LABELS_TO_STRING = """
+    ALTER TABLE "proposals_{model_name}" ALTER COLUMN "labels"
+        SET DATA TYPE varchar(128)
+        USING array_to_string("labels", ',');
+"""
+
+
+def alter_labels(model_name):
+    return migrations.RunSQL(
+        LABELS_TO_ARRAY.format(model_name=model_name),
+        LABELS_TO_STRING.format(model_name=model_name),
+        state_operations=[
+            migrations.AlterField(
+                model_name=model_name,
+                name='labels',
+                field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=32), blank=True, default=list, size=None, verbose_name='labels'),
+            ),
+        ],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0072_proposal_accepted_partial_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='talkproposal',
+            name='accepted',
+            field=models.BooleanField(choices=[(None, '----------'), (True, 'Accepted'), (False, 'Rejected')], default=None, null=True, verbose_name='accepted'),
+        ),
+        migrations.AlterField(
+            model_name='tutorialproposal',
+            name='accepted',
+            field=models.BooleanField(choices=[(None, '----------'), (True, 'Accepted'), (False, 'Rejected')], default=None, null=True, verbose_name='accepted'),
+        ),
+        alter_labels('talkproposal'),
+        alter_labels('tutorialproposal'),
+        migrations.AddIndex(
+            model_name='talkproposal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['labels'], name='talkproposal_labels_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tutorialproposal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['labels'], name='tutorialproposal_labels_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 3.2.25 on 2026-10-15 07:02
+
+from django.db import migrations, models
+
+
+STATUS_TO_INTEGER = """
+    ALTER TABLE "proposals_additionalspeaker" ALTER COLUMN "status"
+        SET DATA TYPE smallint
+        USING CASE "status"
+            WHEN 'accepted' THEN 1
+            WHEN 'declined' THEN 2
+            ELSE 0
+        END;
+"""
+
+STATUS_TO_STRING = """
+    ALTER TABLE "proposals_additionalspeaker" ALTER COLUMN "status"
+        SET DATA TYPE varchar(8)
+        USING CASE "status"
+            WHEN 1 THEN 'accepted'
+            WHEN 2 THEN 'declined'
+            ELSE 'pending'
+        END;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('proposals', '0073_proposal_labels_array'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            STATUS_TO_INTEGER,
+            STATUS_TO_STRING,
+            state_operations=[
+                migrations.AlterField(
+                    model_name='additionalspeaker',
+                    name='status',
+                    field=models.SmallIntegerField(choices=[(0, 'Pending'), (1, 'Accepted'), (2, 'Declined')], default=0),
+                ),
+            ],
+        ),
+    ]
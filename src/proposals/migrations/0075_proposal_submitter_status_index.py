@@ -0,0 +1,35 @@
+# Generated by Django 3.2.25 on 2026-10-15 07:14
+
+import core.models
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('proposals', '0074_additionalspeaker_status_smallint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='talkproposal',
+            name='submitter',
+            field=core.models.BigForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='submitter'),
+        ),
+        migrations.AlterField(
+            model_name='tutorialproposal',
+            name='submitter',
+            field=core.models.BigForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='submitter'),
+        ),
+        migrations.AddIndex(
+            model_name='talkproposal',
+            index=models.Index(fields=['submitter', 'cancelled', 'accepted'], name='talkproposal_submitter_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tutorialproposal',
+            index=models.Index(fields=['submitter', 'cancelled', 'accepted'], name='tutorialproposal_submitter_idx'),
+        ),
+    ]
@@ -1,14 +1,26 @@
-import contextlib
+import operator
+from urllib.parse import quote
 
 from django.conf import settings
-from django.contrib.contenttypes.fields import (
-    GenericForeignKey,
-    GenericRelation,
-)
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
-from django.db.models import Q
-from django.urls import reverse
+from django.db.models import (
+    Case,
+    Exists,
+    Func,
+    OuterRef,
+    Prefetch,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.urls import get_resolver, get_script_prefix, get_urlconf, reverse
+from django.utils.functional import cached_property
+from django.utils.http import RFC3986_SUBDELIMS, escape_leading_slashes
 from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 
@@ -22,12 +34,39 @@ from core.models import (
 )
 
 
+def _reverse_pk(view_name, pk):
+    """Shortcut for ``reverse(view_name, kwargs={'pk': pk})``.
+
+    This relies on Django internals: ``URLResolver.reverse_dict`` (cached per
+    active language) maps a view name to a list of ``(possibilities, pattern,
+    defaults, converters)``, where each possibility is a ``(%-format result,
+    params)`` pair. The pk is substituted into the result, and quoted like
+    ``URLResolver._reverse_with_prefix()`` does. Its check of the result
+    against the pattern is skipped, since a non-negative int always matches
+    the ``\\d+`` pk of proposal URLs. Anything else (e.g. the None pk of an
+    unsaved proposal) falls back to ``reverse()``.
+    """
+    if isinstance(pk, int) and pk >= 0:
+        possibilities = get_resolver(get_urlconf()).reverse_dict.getlist(
+            view_name,
+        )
+        if len(possibilities) == 1:
+            [(result, params)], _, defaults, converters = possibilities[0]
+            if params == ['pk'] and not defaults and not converters:
+                return escape_leading_slashes(get_script_prefix() + quote(
+                    result % {'pk': pk}, safe=RFC3986_SUBDELIMS + '/~:@',
+                ))
+    return reverse(view_name, kwargs={'pk': pk})
+
+
 class PrimarySpeaker:
     """A wapper representing the submitter of the proposal as a speaker.
 
     This class is meant to be compatible with ``AdditionalSpeaker``, and used
     along side with instances of that class.
     """
+    # One is created per proposal on every speaker listing.
+    __slots__ = ('_proposal', '_user', '_user_id')
 
     def __init__(self, *, proposal=None, user=None):
         if proposal is None and user is None:
@@ -35,17 +74,26 @@ class PrimarySpeaker:
         super().__init__()
         self._proposal = proposal
         self._user = user or proposal.submitter
+        self._user_id = self._user.pk
 
     def __repr__(self):
         return f'<PrimarySpeaker: {self.user.speaker_name}>'
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if type(other) is not PrimarySpeaker:
+            return False
+        if self._user_id is None:   # Unsaved users only equal themselves.
+            return self._user is other._user
         return (
-            isinstance(other, PrimarySpeaker) and
-            self.user == other.user and
-            self.proposal == other.proposal
+            self._user_id == other._user_id and
+            self._proposal == other._proposal
         )
 
+    def __hash__(self):
+        return hash(self._user_id)
+
     @property
     def user(self):
         return self._user
@@ -62,6 +110,16 @@ class PrimarySpeaker:
         return gettext('Proposal author')
 
 
+class AdditionalSpeakerQuerySet(models.QuerySet):
+
+    def select_proposals(self):
+        """Join each speaker's proposal (and its submitter) into the query.
+        """
+        return self.select_related(
+            'talk_proposal__submitter', 'tutorial_proposal__submitter',
+        )
+
+
 class AdditionalSpeaker(ConferenceRelated):
 
     user = BigForeignKey(
@@ -70,28 +128,35 @@ class AdditionalSpeaker(ConferenceRelated):
         on_delete=models.CASCADE,
     )
 
-    proposal_type = models.ForeignKey(
-        to='contenttypes.ContentType',
-        verbose_name=_('proposal model type'),
+    # Exactly one of these is set. Concrete foreign keys (instead of a
+    # generic relation) let us join and select_related through them.
+    talk_proposal = BigForeignKey(
+        to='TalkProposal',
+        verbose_name=_('talk proposal'),
         on_delete=models.CASCADE,
+        related_name='additionalspeaker_set',
+        null=True,
+        blank=True,
+        db_index=False,     # Covered by the composite index in Meta.
     )
-    proposal_id = models.BigIntegerField(
-        verbose_name=_('proposal ID'),
+    tutorial_proposal = BigForeignKey(
+        to='TutorialProposal',
+        verbose_name=_('tutorial proposal'),
+        on_delete=models.CASCADE,
+        related_name='additionalspeaker_set',
+        null=True,
+        blank=True,
+        db_index=False,     # Covered by the composite index in Meta.
     )
-    proposal = GenericForeignKey('proposal_type', 'proposal_id')
 
-    SPEAKING_STATUS_PENDING = 'pending'
-    SPEAKING_STATUS_ACCEPTED = 'accepted'
-    SPEAKING_STATUS_DECLINED = 'declined'
-    SPEAKING_STATUS = (
-        (SPEAKING_STATUS_PENDING, _('Pending')),
-        (SPEAKING_STATUS_ACCEPTED, _('Accepted')),
-        (SPEAKING_STATUS_DECLINED, _('Declined')),
-    )
-    status = models.CharField(
-        max_length=8,
-        choices=SPEAKING_STATUS,
-        default=SPEAKING_STATUS_PENDING,
+    class SpeakingStatus(models.IntegerChoices):
+        PENDING = 0, _('Pending')
+        ACCEPTED = 1, _('Accepted')
+        DECLINED = 2, _('Declined')
+
+    status = models.SmallIntegerField(
+        choices=SpeakingStatus.choices,
+        default=SpeakingStatus.PENDING,
     )
 
     cancelled = models.BooleanField(
@@ -100,32 +165,125 @@ class AdditionalSpeaker(ConferenceRelated):
         db_index=True,
     )
 
+    objects = DefaultConferenceManager.from_queryset(AdditionalSpeakerQuerySet)()
+    all_objects = AdditionalSpeakerQuerySet.as_manager()
+
     class Meta:
-        unique_together = ['user', 'proposal_type', 'proposal_id']
-        ordering = ['proposal_type', 'proposal_id', 'pk']
+        unique_together = [
+            ['user', 'talk_proposal'],
+            ['user', 'tutorial_proposal'],
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=(
+                    Q(talk_proposal__isnull=False,
+                      tutorial_proposal__isnull=True) |
+                    Q(talk_proposal__isnull=True,
+                      tutorial_proposal__isnull=False)
+                ),
+                name='additionalspeaker_single_proposal',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['talk_proposal', 'cancelled'],
+                name='addspk_talk_cancelled_idx',
+            ),
+            models.Index(
+                fields=['tutorial_proposal', 'cancelled'],
+                name='addspk_tutorial_cancelled_idx',
+            ),
+        ]
+        ordering = ['talk_proposal', 'tutorial_proposal', 'pk']
         verbose_name = _('additional speaker')
         verbose_name_plural = _('additional speakers')
 
     def __str__(self):
         return f'{self.user.speaker_name} ({self.get_status_display()})'
 
+    @property
+    def proposal(self):
+        return self.talk_proposal or self.tutorial_proposal
+
+    @proposal.setter
+    def proposal(self, proposal):
+        if isinstance(proposal, TalkProposal):
+            self.talk_proposal, self.tutorial_proposal = proposal, None
+        elif isinstance(proposal, TutorialProposal):
+            self.talk_proposal, self.tutorial_proposal = None, proposal
+        else:
+            raise TypeError(f'{proposal!r} is not a proposal')
+
 
 class ProposalQuerySet(models.QuerySet):
 
     def filter_accepted(self):
         return self.filter(cancelled=False, accepted=True)
 
-    def filter_viewable(self, user):
-        return self.filter(
-            Q(submitter=user) |
-            Q(additionalspeaker_set__in=user.cospeaking_info_set.all())
+    @staticmethod
+    def additional_speakers_prefetch(lookup='additionalspeaker_set'):
+        """Build the prefetch of (non-cancelled) additional speakers that
+        ``speakers`` reads.
+
+        Pass a lookup spanning a relation, e.g.
+        ``'proposal__additionalspeaker_set'``, to use it on a queryset of
+        models related to proposals.
+        """
+        return Prefetch(
+            lookup,
+            to_attr='_additional_speakers',
+            queryset=(
+                AdditionalSpeaker.objects
+                .filter(cancelled=False)
+                .select_related('user')
+            ),
         )
 
+    def with_additional_speakers(self):
+        """Prefetch (non-cancelled) additional speakers for ``speakers``.
+        """
+        return self.prefetch_related(self.additional_speakers_prefetch())
+
+    def for_display(self):
+        """Load everything ``speakers`` needs for a list of proposals.
+        """
+        return self.select_related('submitter').with_additional_speakers()
+
+    def with_finished_count(self):
+        """Count filled must-fill fields in the database.
+
+        The must-fill text fields are deferred, and ``finished_fields_count``
+        reads the annotation instead, so list pages don't load every
+        proposal's full text just to check whether it is empty.
+        """
+        fields = self.model._must_fill_fields
+        return self.defer(*fields).annotate(_finished_fields_count=sum(
+            (
+                Case(
+                    When(Q(**{f: ''}) | Q(**{f'{f}__isnull': True}), then=0),
+                    default=1,
+                    output_field=models.IntegerField(),
+                )
+                for f in fields
+            ),
+            Value(0),
+        ))
+
+    def _cospeaking_exists(self, user):
+        return Exists(AdditionalSpeaker.objects.filter(
+            user=user,
+            cancelled=False,
+            **{self.model.additionalspeaker_set.field.name: OuterRef('pk')},
+        ))
+
+    def filter_viewable(self, user):
+        return self.filter(Q(submitter=user) | Q(self._cospeaking_exists(user)))
+
     def filter_reviewable(self, user):
         return self.exclude(
             Q(cancelled=True) |
             Q(submitter=user) |
-            Q(additionalspeaker_set__in=user.cospeaking_info_set.all())
+            Q(self._cospeaking_exists(user))
         )
 
 
@@ -135,6 +293,7 @@ class AbstractProposal(ConferenceRelated, EventInfo):
         to=settings.AUTH_USER_MODEL,
         verbose_name=_('submitter'),
         on_delete=models.CASCADE,
+        db_index=False,     # Covered by the composite index in Meta.
     )
 
     outline = models.TextField(
@@ -156,7 +315,6 @@ class AbstractProposal(ConferenceRelated, EventInfo):
     cancelled = models.BooleanField(
         verbose_name=_('cancelled'),
         default=False,
-        db_index=True,
     )
 
     ACCEPTED_CHOICES = (
@@ -164,66 +322,92 @@ class AbstractProposal(ConferenceRelated, EventInfo):
         (True, _('Accepted')),
         (False, _('Rejected')),
     )
-    accepted = models.NullBooleanField(
+    accepted = models.BooleanField(
         verbose_name=_('accepted'),
+        null=True,
         default=None,
         choices=ACCEPTED_CHOICES,
-        db_index=True,
     )
 
-    additionalspeaker_set = GenericRelation(
-        to=AdditionalSpeaker,
-        content_type_field='proposal_type',
-        object_id_field='proposal_id',
+    # Denormalized count of non-cancelled additional speakers, kept in sync
+    # by ``update_additional_speaker_count``.
+    additional_speaker_count = models.PositiveSmallIntegerField(
+        verbose_name=_('additional speaker count'),
+        default=0,
+        editable=False,
     )
 
     # Generic labels field
-    labels = models.CharField(
+    labels = ArrayField(
+        models.CharField(max_length=32),
         verbose_name=_('labels'),
+        default=list,
         blank=True,
-        max_length=128,
     )
 
     objects = DefaultConferenceManager.from_queryset(ProposalQuerySet)()
     all_objects = ProposalQuerySet.as_manager()
 
-    _must_fill_fields = [
+    _must_fill_fields = (
         'abstract', 'objective', 'supplementary',
         'detailed_description', 'outline',
-    ]
+    )
+    _must_fill_fields_count = len(_must_fill_fields)
+    _must_fill_getter = operator.attrgetter(*_must_fill_fields)
 
     class Meta:
         abstract = True
+        indexes = [
+            # Covers filter_accepted() on the default (conference) manager.
+            models.Index(
+                fields=['conference'],
+                condition=Q(cancelled=False, accepted=True),
+                name='%(class)s_accepted_idx',
+            ),
+            GinIndex(fields=['labels'], name='%(class)s_labels_idx'),
+            # Covers a user's own proposals (dashboard, edit views), all
+            # statuses included since withdrawn ones are listed too.
+            models.Index(
+                fields=['submitter', 'cancelled', 'accepted'],
+                name='%(class)s_submitter_idx',
+            ),
+        ]
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields,
+                   forced_update):
+        # additional_speaker_count is only written by
+        # update_additional_speaker_count. Leave it out of every save's
+        # UPDATE (including saves of instances with deferred fields, which
+        # Django turns into update_fields saves), so a count loaded before a
+        # speaker change is not written back over the current one. This hooks
+        # Model._save_table(), which calls _do_update() with (field, model,
+        # value) triples, and still inserts the row with every field if the
+        # UPDATE matches nothing.
+        values = [
+            value for value in values
+            if value[0].name != 'additional_speaker_count'
+        ]
+        return super()._do_update(
+            base_qs, using, pk_val, values, update_fields, forced_update,
+        )
 
     @property
     def speakers(self):
         yield PrimarySpeaker(proposal=self)
 
-        # Optimization: Callers of this method can annotate the queryset to
-        # avoid lookups when a proposal doesn't have any additional speakers.
-        with contextlib.suppress(AttributeError):
-            if self._additional_speaker_count < 1:
-                return
+        if self.additional_speaker_count < 1:
+            return
 
         # Optimization: Callers of this method can prefetch the additional
         # speaker queryset to avoid n+1 lookups when operating on multiple
         # proposals. Example::
         #
-        #   proposals = TalkProposal.objects.prefetch_related(Prefetch(
-        #       'additionalspeaker_set',
-        #       to_attr='_additional_speakers',
-        #       queryset=(
-        #           AdditionalSpeaker.objects
-        #           .filter(cancelled=False)
-        #           .select_related('user')
-        #       ),
-        #   ))
+        #   proposals = TalkProposal.objects.for_display()
         #   for p in proposals:   # Only two queries: proposals, and speakers.
         #       for s in p.speakers:
         #           print(s.user.email)
-        try:
-            additionals = self._additional_speakers
-        except AttributeError:
+        additionals = getattr(self, '_additional_speakers', None)
+        if additionals is None:
             additionals = (
                 self.additionalspeaker_set
                 .filter(cancelled=False)
@@ -234,31 +418,84 @@ class AbstractProposal(ConferenceRelated, EventInfo):
 
     @property
     def speaker_count(self):
-        # Optimization: Callers of this method can annotate the queryset to
-        # avoid n+1 lookups when operating on multiple proposals.
-        try:
-            count = self._additional_speaker_count
-        except AttributeError:
-            count = self.additionalspeaker_set.filter(cancelled=False).count()
-        return count + 1
+        return self.additional_speaker_count + 1
 
     @property
     def must_fill_fields_count(self):
-        return len(self._must_fill_fields)
+        return self._must_fill_fields_count
 
-    @property
+    # Cached per instance; proposals are loaded fresh for each request, and
+    # not modified after these are read for display.
+    @cached_property
     def finished_fields_count(self):
-        count = sum(1 for f in self._must_fill_fields if getattr(self, f))
+        count = getattr(self, '_finished_fields_count', None)
+        if count is None:   # Not annotated by with_finished_count().
+            count = sum(1 for v in self._must_fill_getter(self) if v)
         return count
 
-    @property
+    @cached_property
     def finish_percentage(self):
         return 100 * self.finished_fields_count // self.must_fill_fields_count
 
-    @property
+    @cached_property
     def unfinished_fields_count(self):
         return self.must_fill_fields_count - self.finished_fields_count
 
+    # URL names are set by subclasses. These are built for every proposal on
+    # list pages, so they skip the full reverse() resolution.
+    def get_peek_url(self):
+        return _reverse_pk(self._peek_url_name, self.pk)
+
+    def get_update_url(self):
+        return _reverse_pk(self._update_url_name, self.pk)
+
+    def get_cancel_url(self):
+        return _reverse_pk(self._cancel_url_name, self.pk)
+
+    def get_manage_speakers_url(self):
+        return _reverse_pk(self._manage_speakers_url_name, self.pk)
+
+
+@receiver([post_save, post_delete], sender=AdditionalSpeaker)
+def update_additional_speaker_count(sender, instance, **kwargs):
+    """Recount the non-cancelled additional speakers of a speaker's proposal.
+
+    The count is recomputed in a single UPDATE instead of incremented, so
+    cancelling, restoring, and deleting speakers are all handled alike.
+
+    Only model saves and deletes send these signals. ``QuerySet.update()``
+    and bulk operations on speakers bypass this receiver, as does the
+    previous proposal when a speaker is moved to another one; the affected
+    proposals' counts are left stale by such changes.
+    """
+    if kwargs.get('raw'):   # Fixtures already carry the serialized count.
+        return
+    if instance.talk_proposal_id is not None:
+        field = sender.talk_proposal.field
+    else:
+        field = sender.tutorial_proposal.field
+    count = (
+        sender.all_objects
+        .filter(cancelled=False, **{field.name: OuterRef('pk')})
+        .order_by()
+        .annotate(count=Func('pk', function='COUNT'))
+        .values('count')
+    )
+    proposal_model = field.related_model
+    proposal_model.all_objects.filter(
+        pk=getattr(instance, field.attname),
+    ).update(additional_speaker_count=Subquery(count))
+
+    # Keep the in-memory proposal (e.g. the one passed to the speaker form)
+    # consistent with the database.
+    if field.is_cached(instance):
+        proposal = field.get_cached_value(instance)
+        if proposal is not None and proposal.pk is not None:
+            proposal.refresh_from_db(fields=['additional_speaker_count'])
+
+
+_TALK_DURATION_DISPLAY = dict(settings.TALK_PROPOSAL_DURATION_CHOICES)
+
 
 class TalkProposal(AbstractProposal):
 
@@ -281,25 +518,10 @@ class TalkProposal(AbstractProposal):
         verbose_name = _('talk proposal')
         verbose_name_plural = _('talk proposals')
 
-    @property
-    def duration_dict(self):
-        if not hasattr(TalkProposal, '_duration_dict'):
-            TalkProposal._duration_dict = dict(
-                settings.TALK_PROPOSAL_DURATION_CHOICES,
-            )
-        return TalkProposal._duration_dict
-
-    def get_peek_url(self):
-        return reverse('talk_proposal_peek', kwargs={'pk': self.pk})
-
-    def get_update_url(self):
-        return reverse('talk_proposal_update', kwargs={'pk': self.pk})
-
-    def get_cancel_url(self):
-        return reverse('talk_proposal_cancel', kwargs={'pk': self.pk})
-
-    def get_manage_speakers_url(self):
-        return reverse('talk_proposal_manage_speakers', kwargs={'pk': self.pk})
+    _peek_url_name = 'talk_proposal_peek'
+    _update_url_name = 'talk_proposal_update'
+    _cancel_url_name = 'talk_proposal_cancel'
+    _manage_speakers_url_name = 'talk_proposal_manage_speakers'
 
     def get_remove_speaker_url(self, speaker):
         return reverse('talk_proposal_remove_speaker', kwargs={
@@ -307,7 +529,7 @@ class TalkProposal(AbstractProposal):
         })
 
     def get_duration_display(self):
-        return self.duration_dict.get(self.duration)
+        return _TALK_DURATION_DISPLAY.get(self.duration)
 
 
 class TutorialProposal(AbstractProposal):
@@ -327,19 +549,10 @@ class TutorialProposal(AbstractProposal):
         verbose_name = _('tutorial proposal')
         verbose_name_plural = _('tutorial proposals')
 
-    def get_peek_url(self):
-        return reverse('tutorial_proposal_peek', kwargs={'pk': self.pk})
-
-    def get_update_url(self):
-        return reverse('tutorial_proposal_update', kwargs={'pk': self.pk})
-
-    def get_cancel_url(self):
-        return reverse('tutorial_proposal_cancel', kwargs={'pk': self.pk})
-
-    def get_manage_speakers_url(self):
-        return reverse('tutorial_proposal_manage_speakers', kwargs={
-            'pk': self.pk,
-        })
+    _peek_url_name = 'tutorial_proposal_peek'
+    _update_url_name = 'tutorial_proposal_update'
+    _cancel_url_name = 'tutorial_proposal_cancel'
+    _manage_speakers_url_name = 'tutorial_proposal_manage_speakers'
 
     def get_remove_speaker_url(self, speaker):
         return reverse('tutorial_proposal_remove_speaker', kwargs={
@@ -347,6 +560,20 @@ class TutorialProposal(AbstractProposal):
         })
 
 
+class LLMReviewQuerySet(models.QuerySet):
+
+    def for_list_view(self):
+        """Order reviews by proposal title for display.
+
+        This is not the model's default ordering so that counts, existence
+        checks, and lookups don't need to join the proposal table to sort.
+        """
+        return (
+            self.select_related('proposal')
+            .order_by('proposal__title', 'stage', '-created_at')
+        )
+
+
 class LLMReview(ConferenceRelated):
     """Model for storing AI-generated reviews of proposals."""
 
@@ -426,11 +653,13 @@ class LLMReview(ConferenceRelated):
         default=''
     )
 
+    objects = DefaultConferenceManager.from_queryset(LLMReviewQuerySet)()
+    all_objects = LLMReviewQuerySet.as_manager()
+
     class Meta:
         verbose_name = _('LLM review')
         verbose_name_plural = _('LLM reviews')
         unique_together = (('proposal', 'stage'),)
-        ordering = ['proposal__title', 'stage', '-created_at']
 
     def __str__(self):
         return f'AI Review for {self.proposal.title} ({self.get_stage_display()})'
@@ -0,0 +1,35 @@
+def test_talk_proposal_label_filter(admin_client, talk_proposal):
+    talk_proposal.labels = ['Community Track']
+    talk_proposal.save()
+
+    response = admin_client.get('/admin/proposals/talkproposal/')
+    assert response.status_code == 200
+    assert response.context['cl'].result_count == 1
+
+    response = admin_client.get(
+        '/admin/proposals/talkproposal/', {'label': 'Community Track'},
+    )
+    assert response.context['cl'].result_count == 1
+
+    response = admin_client.get(
+        '/admin/proposals/talkproposal/', {'label': 'Other'},
+    )
+    assert response.context['cl'].result_count == 0
+
+
+def test_talk_proposal_label_filter_lookups(
+        admin_client, user, talk_proposal):
+    talk_proposal.labels = ['Community Track', 'Beginner']
+    talk_proposal.save()
+    type(talk_proposal).objects.create(
+        submitter=user, title='Another', labels=['Beginner'],
+    )
+
+    response = admin_client.get('/admin/proposals/talkproposal/')
+    label_filter, = (
+        spec for spec in response.context['cl'].filter_specs
+        if getattr(spec, 'parameter_name', None) == 'label'
+    )
+    assert label_filter.lookup_choices == [
+        ('Beginner', 'Beginner'), ('Community Track', 'Community Track'),
+    ]
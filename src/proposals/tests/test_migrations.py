@@ -0,0 +1,61 @@
+import pytest
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+GENERIC_PROPOSAL = ('proposals', '0067_auto_20250512_1734')
+CONCRETE_PROPOSAL = ('proposals', '0068_replace_additionalspeaker_generic_proposal')
+
+
+def migrate(proposals_target=None):
+    """Migrate proposals to the given migration, and other apps to latest.
+    """
+    executor = MigrationExecutor(connection)
+    targets = [
+        node for node in executor.loader.graph.leaf_nodes()
+        if proposals_target is None or node[0] != 'proposals'
+    ]
+    if proposals_target is not None:
+        targets.append(proposals_target)
+    executor.migrate(targets)
+    executor.loader.build_graph()
+    return executor.loader.project_state(targets).apps
+
+
+@pytest.fixture
+def generic_proposal_apps(transactional_db):
+    yield migrate(GENERIC_PROPOSAL)
+    migrate()
+
+
+def test_replace_generic_proposal_drops_dangling_speakers(
+        generic_proposal_apps):
+    apps = generic_proposal_apps
+    User = apps.get_model('users', 'User')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    TalkProposal = apps.get_model('proposals', 'TalkProposal')
+    AdditionalSpeaker = apps.get_model('proposals', 'AdditionalSpeaker')
+
+    submitter = User.objects.create(email='submitter@pycon.tw')
+    speaker = User.objects.create(email='speaker@pycon.tw')
+    talk_type, _ = ContentType.objects.get_or_create(
+        app_label='proposals', model='talkproposal',
+    )
+    user_type, _ = ContentType.objects.get_or_create(
+        app_label='users', model='user',
+    )
+    proposal = TalkProposal.objects.create(submitter=submitter, title='Talk')
+    AdditionalSpeaker.objects.create(
+        user=speaker, proposal_type=talk_type, proposal_id=proposal.pk,
+    )
+    AdditionalSpeaker.objects.create(     # Proposal deleted.
+        user=speaker, proposal_type=talk_type, proposal_id=proposal.pk + 1,
+    )
+    AdditionalSpeaker.objects.create(     # Not a proposal.
+        user=speaker, proposal_type=user_type, proposal_id=submitter.pk,
+    )
+
+    apps = migrate(CONCRETE_PROPOSAL)
+    AdditionalSpeaker = apps.get_model('proposals', 'AdditionalSpeaker')
+    assert list(AdditionalSpeaker.objects.values_list(
+        'user__email', 'talk_proposal__title', 'tutorial_proposal',
+    )) == [('speaker@pycon.tw', 'Talk', None)]
@@ -1,4 +1,8 @@
-from proposals.models import PrimarySpeaker
+import pytest
+from django.urls import NoReverseMatch, reverse
+from django.utils import translation
+
+from proposals.models import AdditionalSpeaker, PrimarySpeaker
 
 
 def test_speaker_compatibility(user, proposal, additional_speaker):
@@ -15,7 +19,175 @@ def test_speaker_compatibility(user, proposal, additional_speaker):
     assert additional_speaker.get_status_display() == 'Pending'
 
 
+def test_primary_speaker_eq(user, another_user, proposal):
+    speaker = PrimarySpeaker(proposal=proposal)
+    assert speaker == PrimarySpeaker(proposal=proposal)
+    assert speaker != PrimarySpeaker(user=user)
+    assert speaker != PrimarySpeaker(user=another_user, proposal=proposal)
+    assert PrimarySpeaker(user=user) == PrimarySpeaker(user=user)
+    assert len({speaker, PrimarySpeaker(proposal=proposal)}) == 1
+    assert not hasattr(speaker, '__dict__')
+
+
 def test_proposal_speakers(user, proposal, additional_speaker):
     assert list(proposal.speakers) == [
         PrimarySpeaker(proposal=proposal), additional_speaker,
     ]
+
+
+def test_proposal_speakers_lazy(
+        django_assert_num_queries, proposal, additional_speaker):
+    proposal = type(proposal).objects.select_related('submitter').get(
+        pk=proposal.pk,
+    )
+    with django_assert_num_queries(0):
+        speakers = proposal.speakers
+        assert next(speakers) == PrimarySpeaker(proposal=proposal)
+    with django_assert_num_queries(1):
+        assert list(speakers) == [additional_speaker]
+
+
+def test_additional_speaker_proposal_fields(proposal_type, additional_speaker):
+    if proposal_type == 'talk':
+        assert additional_speaker.tutorial_proposal_id is None
+        assert additional_speaker.talk_proposal == additional_speaker.proposal
+    else:
+        assert additional_speaker.talk_proposal_id is None
+        assert additional_speaker.tutorial_proposal == additional_speaker.proposal
+
+
+def test_proposal_speaker_count(proposal, additional_speaker):
+    assert proposal.speaker_count == 2
+    assert type(proposal).objects.get(pk=proposal.pk).speaker_count == 2
+
+    additional_speaker.cancelled = True
+    additional_speaker.save()
+    assert type(proposal).objects.get(pk=proposal.pk).speaker_count == 1
+
+    additional_speaker.cancelled = False
+    additional_speaker.save()
+    assert type(proposal).objects.get(pk=proposal.pk).speaker_count == 2
+
+    additional_speaker.delete()
+    assert type(proposal).objects.get(pk=proposal.pk).speaker_count == 1
+
+
+def test_proposal_speaker_count_raw_save(
+        django_assert_num_queries, proposal, another_user):
+    speaker = AdditionalSpeaker(user=another_user, proposal=proposal)
+    with django_assert_num_queries(1):
+        speaker.save_base(raw=True)
+    proposal = type(proposal).objects.get(pk=proposal.pk)
+    assert proposal.additional_speaker_count == 0   # Not recounted.
+
+
+@pytest.mark.parametrize('defer', [(), ('abstract',)])
+def test_proposal_save_keeps_speaker_count(proposal, another_user, defer):
+    stale = type(proposal).objects.defer(*defer).get(pk=proposal.pk)
+    assert stale.additional_speaker_count == 0
+
+    AdditionalSpeaker.objects.create(user=another_user, proposal=proposal)
+    stale.title = 'Stale'
+    stale.save()
+
+    proposal = type(proposal).objects.get(pk=proposal.pk)
+    assert proposal.title == 'Stale'
+    assert proposal.additional_speaker_count == 1
+
+
+def test_proposal_save_reinserts_deleted(proposal):
+    type(proposal).objects.filter(pk=proposal.pk).delete()
+    proposal.save()
+    assert type(proposal).objects.filter(pk=proposal.pk).exists()
+
+
+def test_proposal_for_display(
+        django_assert_num_queries, user, proposal, additional_speaker):
+    with django_assert_num_queries(2):
+        proposals = list(type(proposal).objects.for_display())
+        assert [s.user for p in proposals for s in p.speakers] == [
+            user, additional_speaker.user,
+        ]
+
+
+def test_proposal_filter_viewable(
+        user, another_user, proposal, additional_speaker):
+    proposal_class = type(proposal)
+    assert list(proposal_class.objects.filter_viewable(user)) == [proposal]
+    assert list(proposal_class.objects.filter_viewable(another_user)) == [
+        proposal,
+    ]
+
+    additional_speaker.cancelled = True
+    additional_speaker.save()
+    assert not proposal_class.objects.filter_viewable(another_user).exists()
+
+
+def test_proposal_filter_reviewable(
+        user, another_user, proposal, additional_speaker):
+    proposal_class = type(proposal)
+    assert not proposal_class.objects.filter_reviewable(user).exists()
+    assert not proposal_class.objects.filter_reviewable(another_user).exists()
+
+    additional_speaker.cancelled = True
+    additional_speaker.save()
+    assert list(proposal_class.objects.filter_reviewable(another_user)) == [
+        proposal,
+    ]
+
+
+def test_additional_speaker_select_proposals(
+        django_assert_num_queries, user, another_user, proposal,
+        additional_speaker):
+    with django_assert_num_queries(1):
+        speakers = list(another_user.cospeaking_info_set)
+        assert [s.proposal.submitter for s in speakers] == [user]
+
+
+def test_talk_proposal_duration_display(talk_proposal):
+    talk_proposal.duration = 'PREF30'
+    assert talk_proposal.get_duration_display() == 'Prefer 30min'
+
+
+def test_proposal_finished_fields(proposal):
+    proposal.abstract = 'Abstract'
+    proposal.objective = 'Objective'
+    proposal.outline = ''
+    proposal.supplementary = ''
+    proposal.detailed_description = ''
+    assert proposal.finished_fields_count == 2
+    assert proposal.unfinished_fields_count == 3
+    assert proposal.finish_percentage == 40
+
+
+def test_proposal_with_finished_count(proposal, django_assert_num_queries):
+    proposal.abstract = 'Abstract'
+    proposal.objective = 'Objective'
+    proposal.outline = ''
+    proposal.supplementary = ''
+    proposal.detailed_description = ''
+    proposal.save()
+
+    with django_assert_num_queries(1):
+        proposal, = type(proposal).objects.with_finished_count()
+        assert proposal.finished_fields_count == 2
+        assert proposal.finish_percentage == 40
+
+
+@pytest.mark.parametrize('language', ['en-us', 'zh-hant'])
+def test_proposal_urls(proposal_type, proposal, language):
+    with translation.override(language):
+        for action, get_url in [
+                ('peek', proposal.get_peek_url),
+                ('update', proposal.get_update_url),
+                ('cancel', proposal.get_cancel_url),
+                ('manage_speakers', proposal.get_manage_speakers_url)]:
+            assert get_url() == reverse(
+                f'{proposal_type}_proposal_{action}', kwargs={'pk': proposal.pk},
+            )
+
+
+def test_proposal_urls_unsaved(proposal):
+    proposal = type(proposal)()
+    with pytest.raises(NoReverseMatch):
+        proposal.get_peek_url()
@@ -1,4 +1,5 @@
 from core.utils import set_registry
+from proposals.models import AdditionalSpeaker
 
 
 def test_talk_proposal_manage_speakers_login(client):
@@ -177,7 +178,7 @@ def test_set_speaker_status_get_not_allowed(
 def test_set_speaker_status_post_not_owned(user_client, additional_speaker):
     response = user_client.post(
         '/en-us/proposals/set-speaker-status/81/',
-        {'status': 'declined'},
+        {'status': AdditionalSpeaker.SpeakingStatus.DECLINED},
     )
     assert response.status_code == 404
 
@@ -187,11 +188,14 @@ def test_set_speaker_status_post(
         another_user_client, additional_speaker):
     response = another_user_client.post(
         '/en-us/proposals/set-speaker-status/81/',
-        {'status': 'declined'},
+        {'status': AdditionalSpeaker.SpeakingStatus.DECLINED},
         follow=True,
     )
     assert response.redirect_chain == [('/en-us/dashboard/', 302)]
 
+    additional_speaker.refresh_from_db()
+    assert additional_speaker.status == AdditionalSpeaker.SpeakingStatus.DECLINED
+
 
 @set_registry(**{'proposals.editable': False})
 def test_talk_proposal_manage_speakers_get_disabled(user_client, talk_proposal):
@@ -250,7 +254,7 @@ def test_set_speaker_status_post_disabled(
         another_user_client, additional_speaker):
     response = another_user_client.post(
         '/en-us/proposals/set-speaker-status/81/',
-        {'status': 'declined'},
+        {'status': AdditionalSpeaker.SpeakingStatus.DECLINED},
         follow=True,
     )
 
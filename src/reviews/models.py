@@ -3,13 +3,13 @@ import operator
 
 from django.conf import settings
 from django.db import models
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ugettext
 from registry.helper import reg
 
 from core.models import BigForeignKey, DefaultConferenceManager
-from proposals.models import TalkProposal
+from proposals.models import AdditionalSpeaker, TalkProposal
 
 REVIEW_REQUIRED_PERMISSIONS = ['reviews.add_review']
 
@@ -29,11 +29,13 @@ class ReviewQuerySet(models.QuerySet):
         return qs
 
     def filter_reviewable(self, user):
-        cospeaking = user.cospeaking_info_set.all()
+        cospeaking = AdditionalSpeaker.objects.filter(
+            user=user, cancelled=False, talk_proposal=OuterRef('proposal'),
+        )
         qs = self.exclude(
             Q(proposal__cancelled=True) |
             Q(proposal__submitter=user) |
-            Q(proposal__additionalspeaker_set__in=cospeaking)
+            Q(Exists(cospeaking))
         )
         qs = qs.filter(reviewer=user)
         return qs
@@ -0,0 +1,26 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.utils import set_registry
+from proposals.models import TalkProposal
+
+
+@set_registry(**{'reviews.stage': 1})
+def test_talk_proposal_list_paginator_count(admin_client, talk_proposal):
+    TalkProposal.objects.create(submitter=talk_proposal.submitter, title='B')
+
+    with CaptureQueriesContext(connection) as context:
+        response = admin_client.get('/en-us/reviews/', {'order': 'count'})
+
+    assert response.status_code == 200
+    assert response.context['paginator'].count == 2
+
+    count_queries = [
+        q['sql'] for q in context.captured_queries
+        if q['sql'].startswith('SELECT COUNT(*)') and
+        'proposals_talkproposal' in q['sql']
+    ]
+    assert count_queries
+    for sql in count_queries:
+        assert 'GROUP BY' not in sql
+        assert 'subquery' not in sql
@@ -58,17 +58,19 @@ class TalkProposalListView(ReviewableMixin, PermissionRequiredMixin, ListView):
         params = self.request.GET
         return params.get("category")
 
-    def get_queryset(self):
+    def get_reviewable_queryset(self):
         user = self.request.user
-        qs = (
+        return (
             super()
             .get_queryset()
             .filter_reviewable(user)
             .exclude(accepted__isnull=False)
             .exclude(review__reviewer=user)
-            .annotate(Count("review"))
         )
 
+    def get_queryset(self):
+        qs = self.get_reviewable_queryset().annotate(Count("review"))
+
         ordering = self.get_ordering()
         if ordering == "?":
             # We don't use order_by('?') because it is crazy slow, and instead
@@ -90,6 +92,14 @@ class TalkProposalListView(ReviewableMixin, PermissionRequiredMixin, ListView):
 
         return qs
 
+    def get_paginator(self, queryset, *args, **kwargs):
+        paginator = super().get_paginator(queryset, *args, **kwargs)
+        if not isinstance(queryset, SequenceQuerySet):
+            # Count on the unannotated queryset. Counting the annotated one
+            # wraps the whole GROUP BY query in a subquery.
+            paginator.count = self.get_reviewable_queryset().count()
+        return paginator
+
     def get_category_metrics(self, context):
         count = 0
         categories = set()
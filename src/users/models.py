@@ -251,7 +251,7 @@ class User(AbstractBaseUser, PermissionsMixin):
         return self.additionalspeaker_set.filter(
             cancelled=False,
             conference=settings.CONFERENCE_DEFAULT_SLUG,
-        )
+        ).select_proposals()
 
     @property
     def twitter_profile_url(self):